@@ -7,8 +7,12 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 INSTALL_DIR="$HOME/screensaver"
 SERVICE_NAME="screensaver"
-CONFIG_FILE="$INSTALL_DIR/config.py"
+CONFIG_FILE="$INSTALL_DIR/list_config.py"
 LOG_FILE="$INSTALL_DIR/logs/screensaver.log"
+MONITOR_SCRIPT="$INSTALL_DIR/monitor_screensaver.py"
+
+# Linha de comando do processo (não casa com monitor_screensaver.py)
+PROCESS_PATTERN="python3 screensaver.py"
 
 # Cores para output
 RED='\033[0;31m'
@@ -88,13 +92,8 @@ show_status() {
         echo "Última inicialização: $(systemctl show "$SERVICE_NAME" -p ActiveEnterTimestamp --value 2>/dev/null || echo 'N/A')"
     fi
     
-    # Verificar se processo está rodando
-    if pgrep -f "zagari_screensaver.py" > /dev/null; then
-        local pid=$(pgrep -f "zagari_screensaver.py")
-        echo "PID do processo: $pid"
-        echo "Uso de memória: $(ps -p $pid -o rss= 2>/dev/null | awk '{print $1/1024 " MB"}' || echo 'N/A')"
-        echo "Uso de CPU: $(ps -p $pid -o pcpu= 2>/dev/null | awk '{print $1"%"}' || echo 'N/A')"
-    fi
+    # Processo, memória, CPU e temperatura lidos de /proc e /sys
+    python3 "$MONITOR_SCRIPT" --status 2>/dev/null || echo "Monitor não disponível: $MONITOR_SCRIPT"
     
     echo ""
 }
@@ -122,10 +121,10 @@ start_screensaver() {
     else
         print_status "Iniciando manualmente..."
         cd "$INSTALL_DIR"
-        nohup python3 zagari_screensaver.py > "$LOG_FILE" 2>&1 &
+        nohup python3 screensaver.py > "$LOG_FILE" 2>&1 &
         sleep 2
         
-        if pgrep -f "zagari_screensaver.py" > /dev/null; then
+        if pgrep -f "$PROCESS_PATTERN" > /dev/null; then
             print_status "Screensaver iniciado manualmente!"
         else
             print_error "Falha ao iniciar screensaver"
@@ -145,16 +144,16 @@ stop_screensaver() {
     fi
     
     # Matar processo se ainda estiver rodando
-    if pgrep -f "zagari_screensaver.py" > /dev/null; then
+    if pgrep -f "$PROCESS_PATTERN" > /dev/null; then
         print_status "Encerrando processo..."
-        pkill -f "zagari_screensaver.py"
+        pkill -f "$PROCESS_PATTERN"
         sleep 1
         
-        if ! pgrep -f "zagari_screensaver.py" > /dev/null; then
+        if ! pgrep -f "$PROCESS_PATTERN" > /dev/null; then
             print_status "Processo encerrado!"
         else
             print_warning "Forçando encerramento..."
-            pkill -9 -f "zagari_screensaver.py"
+            pkill -9 -f "$PROCESS_PATTERN"
         fi
     fi
 }
@@ -168,6 +167,19 @@ restart_screensaver() {
     start_screensaver
 }
 
+# Função para recarregar configuração sem reiniciar
+reload_screensaver() {
+    print_header "Recarregando Configuração"
+    
+    # SIGHUP pede a recarga; ela é aplicada na próxima troca de efeito
+    if pkill -HUP -f "$PROCESS_PATTERN"; then
+        print_status "Configuração será aplicada na próxima troca de efeito"
+    else
+        print_error "Screensaver não está rodando"
+        return 1
+    fi
+}
+
 # Função para habilitar inicialização automática
 enable_autostart() {
     print_header "Habilitando Inicialização Automática"
@@ -193,6 +205,18 @@ disable_autostart() {
     fi
 }
 
+# Função para mostrar histórico de performance
+show_monitor() {
+    print_header "Histórico de Performance"
+    
+    if [[ ! -f "$MONITOR_SCRIPT" ]]; then
+        print_error "Monitor não encontrado: $MONITOR_SCRIPT"
+        return 1
+    fi
+    
+    python3 "$MONITOR_SCRIPT" --show "${1:-20}"
+}
+
 # Função para mostrar logs
 show_logs() {
     print_header "Logs do Zagari Screensaver"
@@ -243,7 +267,7 @@ edit_config() {
             return 1
         fi
         
-        print_status "Configuração editada. Reinicie o screensaver para aplicar."
+        print_status "Configuração editada. Ela será aplicada na próxima troca de efeito."
     else
         print_error "Arquivo de configuração não encontrado: $CONFIG_FILE"
         return 1
@@ -254,7 +278,7 @@ edit_config() {
 test_screensaver() {
     print_header "Teste Rápido do Screensaver"
     
-    if [[ ! -f "$INSTALL_DIR/zagari_screensaver.py" ]]; then
+    if [[ ! -f "$INSTALL_DIR/screensaver.py" ]]; then
         print_error "Screensaver não encontrado em $INSTALL_DIR"
         return 1
     fi
@@ -274,7 +298,7 @@ test_screensaver() {
     
     print_status "Executando teste de 10 segundos..."
     cd "$INSTALL_DIR"
-    timeout 10 python3 zagari_screensaver.py || print_warning "Teste interrompido"
+    timeout 10 python3 screensaver.py || print_warning "Teste interrompido"
     
     print_status "Teste concluído!"
 }
@@ -291,9 +315,11 @@ show_help() {
     echo "  start       - Inicia o screensaver"
     echo "  stop        - Para o screensaver"
     echo "  restart     - Reinicia o screensaver"
+    echo "  reload      - Recarrega a configuração sem reiniciar"
     echo "  enable      - Habilita inicialização automática"
     echo "  disable     - Desabilita inicialização automática"
     echo "  logs        - Mostra logs recentes"
+    echo "  monitor [N] - Mostra os últimos N registros de performance"
     echo "  follow      - Acompanha logs em tempo real"
     echo "  config      - Edita arquivo de configuração"
     echo "  test        - Executa teste rápido"
@@ -326,6 +352,9 @@ main() {
         "restart")
             restart_screensaver
             ;;
+        "reload")
+            reload_screensaver
+            ;;
         "enable")
             enable_autostart
             ;;
@@ -335,6 +364,9 @@ main() {
         "logs")
             show_logs
             ;;
+        "monitor")
+            show_monitor "$2"
+            ;;
         "follow")
             follow_logs
             ;;
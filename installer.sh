@@ -232,7 +232,7 @@ main() {
     
     # Copiar script principal para diretório de instalação
     if [[ -f "screensaver.py" ]]; then
-        cp screensaver.py "$INSTALL_DIR/"
+        cp screensaver.py list_config.py monitor_screensaver.py "$INSTALL_DIR/"
     else
         echo "Erro: screensaver.py não encontrado no diretório atual"
         echo "Certifique-se de que o arquivo está no mesmo diretório do instalador"
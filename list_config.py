@@ -87,6 +87,9 @@ EFFECT_CONFIG = {
         "speed_max": 4,
         "color_change_on_bounce": True,
         "trails": False,
+        # Modo enxame: vários textos colidindo entre si
+        "swarm": False,
+        "swarm_collisions": True,
     },
     
     "fade": {
@@ -94,6 +97,7 @@ EFFECT_CONFIG = {
         "fade_speed": 1.0,
         "color_cycle": True,
         "pulse_scale": False,
+        "pulse_amount": 0.2,
     },
     
     "orbital": {
@@ -102,6 +106,10 @@ EFFECT_CONFIG = {
         "speed": 1.0,
         "elliptical": False,
         "color_rotation": True,
+        "trails": False,
+        # Cada letra segue sua própria fase na órbita
+        "per_glyph": True,
+        "word_count": 1,
     },
     
     "matrix": {
@@ -118,6 +126,9 @@ EFFECT_CONFIG = {
         "frequency": 2.0,
         "speed": 2,
         "color_wave": True,
+        # Cada letra segue sua própria fase na onda
+        "per_glyph": True,
+        "word_count": 1,
     },
 }
 
@@ -187,6 +198,8 @@ PERFORMANCE_CONFIG = {
         "max_objects": 3,
         "effects_enabled": ["bouncing", "fade"],
         "use_dirty_rects": True,
+        "swarm_objects": 3,
+        "trail_length": 4,
     },
     
     RPiModel.PI_1: {
@@ -195,6 +208,8 @@ PERFORMANCE_CONFIG = {
         "max_objects": 3,
         "effects_enabled": ["bouncing", "fade", "orbital"],
         "use_dirty_rects": True,
+        "swarm_objects": 3,
+        "trail_length": 4,
     },
     
     RPiModel.PI_2: {
@@ -203,6 +218,8 @@ PERFORMANCE_CONFIG = {
         "max_objects": 5,
         "effects_enabled": ["bouncing", "fade", "orbital", "matrix", "wave"],
         "use_dirty_rects": False,
+        "swarm_objects": 5,
+        "trail_length": 6,
     },
     
     RPiModel.PI_3: {
@@ -211,6 +228,8 @@ PERFORMANCE_CONFIG = {
         "max_objects": 7,
         "effects_enabled": ["bouncing", "fade", "orbital", "matrix", "wave"],
         "use_dirty_rects": False,
+        "swarm_objects": 7,
+        "trail_length": 8,
     },
     
     RPiModel.PI_4: {
@@ -219,6 +238,8 @@ PERFORMANCE_CONFIG = {
         "max_objects": 10,
         "effects_enabled": ["bouncing", "fade", "orbital", "matrix", "wave"],
         "use_dirty_rects": False,
+        "swarm_objects": 16,
+        "trail_length": 12,
     },
 }
 
@@ -303,6 +324,16 @@ ADVANCED_CONFIG = {
     # Usar sprites pré-renderizados
     "prerender_sprites": True,
     
+    # Cadeia de escalas pré-calculadas (Matrix e pulse_scale)
+    "scale_chain_min": 0.5,
+    "scale_chain_max": 1.2,
+    "scale_chain_step": 0.05,
+    "scale_chain_smooth": True,
+    "scale_chain_max_kb": 512,
+    
+    # Limite total das cadeias em cache (todas as cores, inclusive pulse_scale)
+    "scale_chain_cache_kb": 4096,
+    
     # Limitar uso de memória
     "memory_limit_mb": 64,
     
@@ -378,6 +409,13 @@ def get_current_config():
     
     return base_config
 
+def get_performance_config(model=None):
+    """Retorna otimizações do modelo (PI_2 quando não reconhecido)"""
+    if model is None:
+        model = RPI_MODEL
+    
+    return PERFORMANCE_CONFIG.get(model, PERFORMANCE_CONFIG[RPiModel.PI_2])
+
 def get_color_palette(palette_name=None):
     """Retorna paleta de cores ativa"""
     if palette_name is None:
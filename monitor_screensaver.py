@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Monitor do Screensaver - leitura direta de /proc e /sys
+Substitui vcgencmd, free, ps e pgrep por leituras de arquivo, sem criar
+processos que disputem a CPU com o renderizador
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+PROC_ROOT = "/proc"
+SYS_ROOT = "/sys"
+
+# Nome do script observado (comparado com o argv do processo, não com substring)
+PROCESS_NAME = "screensaver.py"
+
+# Amostra a cada 5 s e grava uma linha por janela de 6 amostras (30 s)
+DEFAULT_INTERVAL = 5
+DEFAULT_WINDOW = 6
+DEFAULT_OUTPUT = os.path.expanduser("~/screensaver/logs/monitor.jsonl")
+
+# Ao passar deste tamanho o arquivo mantém só a metade mais recente
+MAX_OUTPUT_BYTES = 256 * 1024
+
+METRICS = ("cpu_pct", "rss_mb", "sys_cpu_pct", "mem_avail_mb", "temp_c")
+
+# =============================================================================
+# LEITURAS DE /proc E /sys
+# =============================================================================
+
+def find_pids(name: str = PROCESS_NAME, proc_root: str = PROC_ROOT) -> List[int]:
+    """Procura processos cujo argv contenha o script (equivalente a pgrep)"""
+    pids = []
+    own_pid = os.getpid()
+    
+    for entry in os.listdir(proc_root):
+        if not entry.isdigit() or int(entry) == own_pid:
+            continue
+        try:
+            with open(os.path.join(proc_root, entry, "cmdline"), "rb") as f:
+                argv = f.read().split(b"\0")
+        except OSError:
+            continue  # Processo terminou durante a varredura
+        
+        # Script executado direto ou como argumento do interpretador Python
+        names = [os.path.basename(arg.decode(errors="replace")) for arg in argv if arg]
+        if names and (names[0] == name or
+                      (names[0].startswith("python") and name in names[1:])):
+            pids.append(int(entry))
+    
+    return sorted(pids)
+
+def read_process_ticks(pid: int, proc_root: str = PROC_ROOT) -> Optional[int]:
+    """utime + stime do processo (em ticks de clock)"""
+    try:
+        with open(os.path.join(proc_root, str(pid), "stat")) as f:
+            stat = f.read()
+    except OSError:
+        return None
+    
+    # O nome do processo pode conter espaços: os campos começam após o último ')'
+    fields = stat[stat.rfind(")") + 2:].split()
+    return int(fields[11]) + int(fields[12])
+
+def read_process_rss_kb(pid: int, proc_root: str = PROC_ROOT) -> Optional[int]:
+    """Memória residente (VmRSS) do processo em kB"""
+    try:
+        with open(os.path.join(proc_root, str(pid), "status")) as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def read_system_ticks(proc_root: str = PROC_ROOT) -> Tuple[int, int, int]:
+    """Ticks ocupados, ticks totais e número de CPUs a partir de /proc/stat"""
+    busy = total = cpus = 0
+    
+    with open(os.path.join(proc_root, "stat")) as f:
+        for line in f:
+            if line.startswith("cpu "):
+                values = [int(v) for v in line.split()[1:]]
+                total = sum(values[:8])  # guest já está contado em user
+                idle = values[3] + (values[4] if len(values) > 4 else 0)
+                busy = total - idle
+            elif line.startswith("cpu"):
+                cpus += 1
+    
+    return busy, total, max(cpus, 1)
+
+def read_meminfo(proc_root: str = PROC_ROOT) -> Dict[str, int]:
+    """Campos de /proc/meminfo em kB"""
+    meminfo = {}
+    
+    with open(os.path.join(proc_root, "meminfo")) as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            parts = value.split()
+            if parts:
+                meminfo[key] = int(parts[0])
+    
+    return meminfo
+
+def read_cpu_temp(sys_root: str = SYS_ROOT) -> Optional[float]:
+    """Temperatura da CPU em °C (mesmo valor de vcgencmd measure_temp)"""
+    try:
+        with open(os.path.join(sys_root, "class/thermal/thermal_zone0/temp")) as f:
+            return int(f.read().strip()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+# =============================================================================
+# AMOSTRAGEM E AGREGAÇÃO
+# =============================================================================
+
+class Sampler:
+    """Coleta amostras e agrega min/avg/max por janela
+    
+    O uso de CPU é calculado pela diferença de ticks entre duas amostras,
+    usando os ticks totais de /proc/stat como relógio; por isso a primeira
+    amostra não tem CPU e uma árvore /proc falsa basta para testar.
+    """
+    
+    def __init__(self, proc_root: str = PROC_ROOT, sys_root: str = SYS_ROOT,
+                 name: str = PROCESS_NAME):
+        self.proc_root = proc_root
+        self.sys_root = sys_root
+        self.name = name
+        self.pid = None
+        self.prev_process_ticks = None
+        self.prev_busy = None
+        self.prev_total = None
+        self.reset_window()
+    
+    def reset_window(self):
+        """Zera os acumuladores [min, soma, max, contagem] de cada métrica"""
+        self.window = {metric: [None, 0.0, None, 0] for metric in METRICS}
+        self.window_samples = 0
+    
+    def sample(self) -> Dict[str, Optional[float]]:
+        """Lê uma amostra e a acumula na janela atual"""
+        values = dict.fromkeys(METRICS)
+        
+        # Sistema
+        busy, total, cpus = read_system_ticks(self.proc_root)
+        delta_total = total - self.prev_total if self.prev_total is not None else 0
+        if delta_total > 0:
+            values["sys_cpu_pct"] = 100.0 * (busy - self.prev_busy) / delta_total
+        
+        meminfo = read_meminfo(self.proc_root)
+        if "MemAvailable" in meminfo:
+            values["mem_avail_mb"] = meminfo["MemAvailable"] / 1024.0
+        values["temp_c"] = read_cpu_temp(self.sys_root)
+        
+        # Processo (procura de novo se ainda não achou ou se ele terminou)
+        process_ticks = None
+        if self.pid is not None:
+            process_ticks = read_process_ticks(self.pid, self.proc_root)
+        if process_ticks is None:
+            pids = find_pids(self.name, self.proc_root)
+            self.pid = pids[0] if pids else None
+            self.prev_process_ticks = None
+            if self.pid is not None:
+                process_ticks = read_process_ticks(self.pid, self.proc_root)
+        
+        if process_ticks is not None:
+            rss_kb = read_process_rss_kb(self.pid, self.proc_root)
+            if rss_kb is not None:
+                values["rss_mb"] = rss_kb / 1024.0
+            if self.prev_process_ticks is not None and delta_total > 0:
+                # Percentual de um núcleo, como em ps/top
+                values["cpu_pct"] = (100.0 * (process_ticks - self.prev_process_ticks)
+                                     * cpus / delta_total)
+        
+        self.prev_process_ticks = process_ticks
+        self.prev_busy = busy
+        self.prev_total = total
+        
+        for metric, value in values.items():
+            if value is None:
+                continue
+            stats = self.window[metric]
+            stats[0] = value if stats[0] is None else min(stats[0], value)
+            stats[1] += value
+            stats[2] = value if stats[2] is None else max(stats[2], value)
+            stats[3] += 1
+        self.window_samples += 1
+        
+        return values
+    
+    def flush(self, timestamp: Optional[float] = None) -> Dict:
+        """Fecha a janela atual e retorna o registro compacto"""
+        record = {
+            "t": int(timestamp if timestamp is not None else time.time()),
+            "n": self.window_samples,
+            "pid": self.pid,
+        }
+        for metric, (low, total, high, count) in self.window.items():
+            if count:
+                record[metric] = [round(low, 1), round(total / count, 1), round(high, 1)]
+        
+        self.reset_window()
+        return record
+
+def append_record(path: str, record: Dict):
+    """Acrescenta um registro (uma linha JSON) ao arquivo de série temporal"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    with open(path, "a") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    
+    if os.path.getsize(path) > MAX_OUTPUT_BYTES:
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, "w") as f:
+            f.writelines(lines[len(lines) // 2:])
+
+def read_records(path: str, count: int) -> List[Dict]:
+    """Últimos registros do arquivo de série temporal"""
+    if count <= 0:
+        return []  # lines[-0:] devolveria o arquivo inteiro
+    
+    try:
+        with open(path) as f:
+            lines = f.readlines()[-count:]
+    except OSError:
+        return []
+    
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue  # Linha incompleta (gravação interrompida)
+    return records
+
+# =============================================================================
+# SAÍDA
+# =============================================================================
+
+def format_stats(stats: Optional[List[float]], unit: str) -> str:
+    if not stats:
+        return "N/A"
+    return f"{stats[0]:.1f}/{stats[1]:.1f}/{stats[2]:.1f}{unit}"
+
+def show_records(path: str, count: int):
+    """Imprime os últimos registros em tabela (min/avg/max)"""
+    records = read_records(path, count)
+    if not records:
+        print(f"Nenhum registro em {path}")
+        return
+    
+    print(f"{'hora':<9}{'pid':>7}  {'CPU %':<18}{'RSS MB':<18}{'Sistema %':<18}"
+          f"{'Livre MB':<21}{'Temp °C':<18}")
+    for record in records:
+        print(f"{time.strftime('%H:%M:%S', time.localtime(record['t'])):<9}"
+              f"{record.get('pid') or '-':>7}  "
+              f"{format_stats(record.get('cpu_pct'), ''):<18}"
+              f"{format_stats(record.get('rss_mb'), ''):<18}"
+              f"{format_stats(record.get('sys_cpu_pct'), ''):<18}"
+              f"{format_stats(record.get('mem_avail_mb'), ''):<21}"
+              f"{format_stats(record.get('temp_c'), ''):<18}")
+    print("(valores min/avg/max por janela)")
+
+def show_status(sampler: Sampler, path: str):
+    """Estado atual do processo e do sistema (usado por control.sh status)"""
+    sampler.sample()
+    time.sleep(0.5)
+    values = sampler.sample()
+    
+    if sampler.pid is not None:
+        print(f"PID do processo: {sampler.pid}")
+        print(f"Uso de memória: {values['rss_mb']:.1f} MB" if values["rss_mb"] is not None
+              else "Uso de memória: N/A")
+        print(f"Uso de CPU: {values['cpu_pct']:.1f}%" if values["cpu_pct"] is not None
+              else "Uso de CPU: N/A")
+    else:
+        print("Processo: não encontrado")
+    
+    if values["temp_c"] is not None:
+        print(f"Temperatura CPU: {values['temp_c']:.1f}°C")
+    else:
+        print("Temperatura CPU: N/A")
+    
+    meminfo = read_meminfo(sampler.proc_root)
+    if "MemAvailable" in meminfo and "MemTotal" in meminfo:
+        print(f"Memória disponível: {meminfo['MemAvailable'] // 1024} MB "
+              f"de {meminfo['MemTotal'] // 1024} MB")
+    
+    records = read_records(path, 1)
+    if records:
+        record = records[0]
+        print(f"Última janela ({time.strftime('%H:%M:%S', time.localtime(record['t']))}, "
+              f"{record['n']} amostras): CPU {format_stats(record.get('cpu_pct'), '%')}, "
+              f"temperatura {format_stats(record.get('temp_c'), '°C')}")
+
+def run(sampler: Sampler, path: str, interval: float, window: int):
+    """Loop de monitoramento: uma linha no arquivo a cada janela"""
+    print(f"Monitorando {sampler.name} a cada {interval}s, "
+          f"janela de {window} amostras -> {path}")
+    
+    while True:
+        sampler.sample()
+        if sampler.window_samples >= window:
+            record = sampler.flush()
+            append_record(path, record)
+            print(json.dumps(record, separators=(",", ":")), flush=True)
+        time.sleep(interval)
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Monitor do Zagari Screensaver")
+    parser.add_argument("--status", action="store_true",
+                        help="mostra o estado atual e sai")
+    parser.add_argument("--show", type=int, metavar="N",
+                        help="imprime os últimos N registros e sai")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help="segundos entre amostras")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help="amostras por registro")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="arquivo de série temporal (JSON por linha)")
+    parser.add_argument("--proc-root", default=PROC_ROOT)
+    parser.add_argument("--sys-root", default=SYS_ROOT)
+    args = parser.parse_args()
+    
+    sampler = Sampler(args.proc_root, args.sys_root)
+    
+    try:
+        if args.status:
+            show_status(sampler, args.output)
+        elif args.show is not None:
+            show_records(args.output, args.show)
+        else:
+            run(sampler, args.output, args.interval, args.window)
+    except KeyboardInterrupt:
+        print("\nSaindo...")
+
+if __name__ == "__main__":
+    main()
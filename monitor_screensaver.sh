@@ -1,17 +1,8 @@
 #!/bin/bash
 # monitor_screensaver.sh
 # Monitora performance do screensaver
+# Lê /proc e /sys diretamente (sem vcgencmd, free, ps ou pgrep a cada ciclo)
 
-while true; do
-    echo "=== $(date) ==="
-    echo "CPU Temperature: $(vcgencmd measure_temp)"
-    echo "Memory Usage:"
-    free -h
-    echo "GPU Memory Split:"
-    vcgencmd get_mem arm
-    vcgencmd get_mem gpu
-    echo "Screensaver Process:"
-    ps aux | grep screensaver | grep -v grep
-    echo "------------------------"
-    sleep 30
-done
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+exec python3 "$SCRIPT_DIR/monitor_screensaver.py" "$@"
@@ -10,14 +10,19 @@ import time
 import random
 import sys
 import os
+import ctypes
+import importlib
+import signal
+import struct
 from enum import Enum
 from dataclasses import dataclass
 from typing import Tuple, List
 
+import list_config as config
+
 # Configurações otimizadas para RPi 2
 SCREEN_WIDTH = 720  # Resolução HD
 SCREEN_HEIGHT = 576  # Resolução HD
-FPS = 20  # Baixo FPS para economizar CPU
 COLORS = {
     'BLACK': (0, 0, 0),
     'WHITE': (255, 255, 255),
@@ -29,6 +34,29 @@ COLORS = {
     'PURPLE': (255, 0, 255)
 }
 
+# Tabelas de seno/cosseno (tamanho potência de 2 para indexar com máscara)
+TRIG_TABLE_SIZE = 1024
+TRIG_TABLE_MASK = TRIG_TABLE_SIZE - 1
+TRIG_TABLE_SCALE = TRIG_TABLE_SIZE / (2 * math.pi)
+SIN_TABLE = [math.sin(i / TRIG_TABLE_SCALE) for i in range(TRIG_TABLE_SIZE)]
+COS_TABLE = [math.cos(i / TRIG_TABLE_SCALE) for i in range(TRIG_TABLE_SIZE)]
+
+# Fases pré-tingidas do ciclo de cores dos glifos
+GLYPH_COLOR_STEPS = 32
+
+# Fases do ciclo de cores do fade quando pulse_scale usa a cadeia de escalas
+FADE_PULSE_COLOR_STEPS = 16
+
+def cycle_color(phase: float) -> Tuple[int, int, int]:
+    """Cor do ciclo usado pelos efeitos: 127 + 127 * sin(fase + 0/2/4)"""
+    return (int(127 + 127 * math.sin(phase)),
+            int(127 + 127 * math.sin(phase + 2)),
+            int(127 + 127 * math.sin(phase + 4)))
+
+# Cores fixas do fade com pulse_scale: cada uma ganha sua cadeia de escalas
+FADE_PULSE_COLORS = [cycle_color(2 * math.pi * step / FADE_PULSE_COLOR_STEPS)
+                     for step in range(FADE_PULSE_COLOR_STEPS)]
+
 class EffectType(Enum):
     BOUNCING = 1
     FADE = 2
@@ -47,14 +75,305 @@ class TextObject:
     angle: float
     scale: float
 
+class GlyphSet:
+    """Glifos de um texto pré-renderizados, com offsets de kerning
+    
+    Os efeitos usam a cor 127 + 127 * sin(fase + 0/2/4), que depende só da
+    fase; por isso os glifos são tingidos uma única vez para
+    GLYPH_COLOR_STEPS fases e o desenho apenas escolhe a fase mais próxima.
+    """
+    
+    def __init__(self, font: pygame.font.Font, text: str, steps: int = GLYPH_COLOR_STEPS):
+        # font.size do prefixo já inclui o kerning entre as letras anteriores
+        self.offsets = [font.size(text[:i])[0] for i in range(len(text))]
+        self.width, self.height = font.size(text)
+        self.steps = steps
+        
+        white = [font.render(char, True, COLORS['WHITE']) for char in text]
+        self.ramp = []
+        for step in range(steps):
+            color = cycle_color(2 * math.pi * step / steps)
+            tinted = []
+            for glyph in white:
+                glyph = glyph.copy()
+                glyph.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+                tinted.append(glyph)
+            self.ramp.append(tinted)
+    
+    def color_index(self, table_index: int) -> int:
+        """Converte um índice das tabelas trigonométricas em fase de cor"""
+        return (table_index & TRIG_TABLE_MASK) * self.steps // TRIG_TABLE_SIZE
+
+class ScaleChain:
+    """Cadeia de tamanhos pré-calculados de um sprite
+    
+    Os níveis são gerados uma única vez em passos fixos de escala a partir
+    de 1.0 (que reaproveita o próprio sprite), sempre dentro de
+    [min_scale, max_scale]; no desenho é escolhido o nível mais próximo,
+    sem escalar por frame. Se a cadeia passar de max_bytes o passo é
+    dobrado e, se ainda assim não couber, os níveis das pontas são
+    descartados.
+    """
+    
+    def __init__(self, surface: pygame.Surface, min_scale: float, max_scale: float,
+                 step: float, smooth: bool = True, max_bytes: int = 512 * 1024):
+        self.check_params(min_scale, max_scale, step)
+        
+        width, height = surface.get_size()
+        bytes_per_pixel = surface.get_bytesize()
+        
+        def level_bytes(scale):
+            # O nível 1.0 é o próprio sprite, sem memória extra
+            if abs(scale - 1.0) < 1e-6:
+                return 0
+            return int(width * scale) * int(height * scale) * bytes_per_pixel
+        
+        def grid(step):
+            # Índices k com 1.0 + k * step dentro do intervalo
+            first = math.ceil((min_scale - 1.0) / step - 1e-6)
+            last = math.floor((max_scale - 1.0) / step + 1e-6)
+            return [1.0 + k * step for k in range(first, last + 1)]
+        
+        scales = grid(step)
+        while len(scales) > 2 and sum(map(level_bytes, scales)) > max_bytes:
+            step *= 2
+            scales = grid(step)
+        
+        # Ainda acima do limite: descarta as pontas (maiores acima de 1.0 primeiro)
+        while scales and sum(map(level_bytes, scales)) > max_bytes:
+            if scales[-1] > 1.0 + 1e-6:
+                scales.pop()
+            else:
+                scales.pop(0)
+        
+        if not scales:
+            # Intervalo sem 1.0 e nenhum nível cabe: usa só o sprite original
+            print(f"Aviso: cadeia de escalas não cabe em {max_bytes // 1024} KB, usando escala 1.0")
+            scales = [1.0]
+        
+        self.first_scale = scales[0]
+        self.step = step
+        self.nbytes = sum(map(level_bytes, scales))
+        self.levels = []
+        for scale in scales:
+            if level_bytes(scale) == 0:
+                self.levels.append(surface)
+                continue
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            if smooth and bytes_per_pixel >= 3:
+                self.levels.append(pygame.transform.smoothscale(surface, new_size))
+            else:
+                self.levels.append(pygame.transform.scale(surface, new_size))
+    
+    @staticmethod
+    def check_params(min_scale: float, max_scale: float, step: float):
+        """Levanta ValueError se os parâmetros não formam uma cadeia válida"""
+        if step <= 0 or min_scale <= 0 or min_scale > max_scale:
+            raise ValueError(f"Cadeia de escalas inválida: {min_scale}..{max_scale} passo {step}")
+    
+    def get(self, scale: float) -> pygame.Surface:
+        """Retorna o nível mais próximo da escala pedida"""
+        index = int(round((scale - self.first_scale) / self.step))
+        return self.levels[min(max(index, 0), len(self.levels) - 1)]
+
+class SpatialGrid:
+    """Grade espacial uniforme para colisões entre objetos do mesmo tamanho
+    
+    Cada célula tem o tamanho de um objeto, então basta comparar a própria
+    célula e as vizinhas. As células são listas encadeadas em arrays
+    pré-alocados (heads/next), reconstruídas no lugar a cada passo.
+    """
+    
+    # Vizinhos "para frente": cada par de células é visitado uma única vez
+    NEIGHBOR_OFFSETS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+    
+    def __init__(self, width: int, height: int, cell_width: int, cell_height: int,
+                 capacity: int):
+        self.cell_width = max(1, cell_width)
+        self.cell_height = max(1, cell_height)
+        self.cols = width // self.cell_width + 1
+        self.rows = height // self.cell_height + 1
+        self.heads = [-1] * (self.cols * self.rows)
+        self.empty_heads = [-1] * (self.cols * self.rows)
+        self.next = [-1] * capacity
+        self.cell_x = [0] * capacity
+        self.cell_y = [0] * capacity
+        self.pair_checks = 0
+    
+    def rebuild(self, objects: List[TextObject]):
+        """Redistribui os objetos nas células sem alocar novas listas"""
+        heads = self.heads
+        heads[:] = self.empty_heads
+        max_col = self.cols - 1
+        max_row = self.rows - 1
+        
+        for i in range(len(objects)):
+            obj = objects[i]
+            cx = min(max(int(obj.x) // self.cell_width, 0), max_col)
+            cy = min(max(int(obj.y) // self.cell_height, 0), max_row)
+            self.cell_x[i] = cx
+            self.cell_y[i] = cy
+            cell = cy * self.cols + cx
+            self.next[i] = heads[cell]
+            heads[cell] = i
+    
+    def query_pairs(self, objects: List[TextObject], handler):
+        """Chama handler(a, b) para cada par de objetos sobrepostos"""
+        heads = self.heads
+        nxt = self.next
+        width = self.cell_width
+        height = self.cell_height
+        checks = 0
+        
+        for i in range(len(objects)):
+            a = objects[i]
+            cx = self.cell_x[i]
+            cy = self.cell_y[i]
+            
+            # Mesma célula: só os sucessores na lista encadeada
+            j = nxt[i]
+            while j != -1:
+                b = objects[j]
+                checks += 1
+                if abs(a.x - b.x) < width and abs(a.y - b.y) < height:
+                    handler(a, b)
+                j = nxt[j]
+            
+            # Células vizinhas
+            for ox, oy in self.NEIGHBOR_OFFSETS:
+                nx = cx + ox
+                ny = cy + oy
+                if nx < 0 or nx >= self.cols or ny >= self.rows:
+                    continue
+                j = heads[ny * self.cols + nx]
+                while j != -1:
+                    b = objects[j]
+                    checks += 1
+                    if abs(a.x - b.x) < width and abs(a.y - b.y) < height:
+                        handler(a, b)
+                    j = nxt[j]
+        
+        self.pair_checks = checks
+
+class ConfigWatcher:
+    """Observa o arquivo de configuração sem consumir CPU entre consultas
+    
+    Usa inotify no diretório do arquivo (editores costumam salvar
+    renomeando um arquivo temporário). Sem inotify, compara o mtime.
+    """
+    
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.filename = os.path.basename(self.path)
+        self.fd = None
+        self.mtime = self.read_mtime()
+        
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                mask = (self.IN_MODIFY | self.IN_ATTRIB | self.IN_CLOSE_WRITE |
+                        self.IN_MOVED_TO | self.IN_CREATE)
+                if libc.inotify_add_watch(fd, os.path.dirname(self.path).encode(), mask) >= 0:
+                    self.fd = fd
+                else:
+                    os.close(fd)
+        except (OSError, AttributeError):
+            self.fd = None
+    
+    def read_mtime(self) -> float:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return 0.0
+    
+    def changed(self) -> bool:
+        """Indica se o arquivo mudou desde a última consulta"""
+        if self.fd is None:
+            mtime = self.read_mtime()
+            changed = mtime != self.mtime
+            self.mtime = mtime
+            return changed
+        
+        changed = False
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                if name == self.filename:
+                    changed = True
+        return changed
+    
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+# Chaves de EFFECT_CONFIG lidas pelos efeitos (conferidas antes de aplicar)
+REQUIRED_EFFECT_KEYS = {
+    "bouncing": ("swarm", "swarm_collisions", "trails"),
+    "fade": ("pulse_scale", "pulse_amount"),
+    "orbital": ("radius", "speed", "elliptical", "trails", "per_glyph", "word_count"),
+    "matrix": (),
+    "wave": ("amplitude", "frequency", "speed", "per_glyph", "word_count"),
+}
+
+def check_positive_int(name: str, value, minimum: int = 1):
+    """Levanta ValueError se value não for um inteiro >= minimum"""
+    if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+        raise ValueError(f"{name} deve ser um inteiro >= {minimum}: {value!r}")
+
 class ZagariScreensaver:
     def __init__(self):
         self.running = True
         self.current_effect = EffectType.BOUNCING
-        self.effect_duration = 10000  # 10 segundos por efeito
         self.effect_start_time = 0
         self.text_objects = []
-        self.font_size = 72
+        self.swarm_grid = None
+        
+        # Valores em cache que dependem de list_config (preenchidos em apply_config)
+        self.text = None
+        self.font_size = None
+        self.palette = None
+        self.scale_chain_settings = None
+        self.trail_length = None
+        
+        # Cadeias de escala: cache por cor e as do pulse_scale, num só limite em bytes
+        self.scale_chains = {}
+        self.scale_chain_bytes = 0
+        self.pulse_chains = {}
+        self.pulse_chains_key = None
+        self.pulse_chain_bytes = 0
+        
+        # Dirty rects: só as áreas alteradas são enviadas ao display
+        self.dirty_rects = []
+        self.full_redraw = True
+        
+        # Rastros: superfície de acumulação reaproveitada entre frames
+        self.trail_surface = None
+        self.trails_active = False
+        self.trail_index = 0
+        
+        # Modos por letra (wave e orbital)
+        self.glyph_words = False
+        self.glyph_blits = []
         
         # Inicializar pygame
         pygame.init()
@@ -62,10 +381,13 @@ class ZagariScreensaver:
         # Configurar display (tenta framebuffer primeiro)
         self.init_display()
         
-        # Configurar fonte
-        self.font = pygame.font.Font(None, self.font_size)
-        self.text_surface = self.font.render("ZAGARI", True, COLORS['WHITE'])
-        self.text_rect = self.text_surface.get_rect()
+        # Configuração, fonte e sprites pré-renderizados
+        self.apply_config()
+        
+        # Recarga da configuração: arquivo observado ou SIGHUP (control.sh reload)
+        self.config_watcher = ConfigWatcher(config.__file__)
+        self.reload_requested = False
+        signal.signal(signal.SIGHUP, self.request_reload)
         
         # Clock para controle de FPS
         self.clock = pygame.time.Clock()
@@ -73,6 +395,131 @@ class ZagariScreensaver:
         # Inicializar primeiro efeito
         self.init_effect()
         
+    def apply_config(self):
+        """Aplica list_config, reconstruindo só os caches afetados pela mudança
+        
+        Tudo é lido, validado e montado em variáveis locais antes de trocar
+        o estado; se algo falhar, a exceção sai daqui sem alterar nada.
+        """
+        # Leitura e validação
+        if not isinstance(config.TEXT, str) or not config.TEXT:
+            raise ValueError(f"TEXT deve ser um texto não vazio: {config.TEXT!r}")
+        check_positive_int("FONT_SIZE", config.FONT_SIZE)
+        
+        effect_config = config.EFFECT_CONFIG
+        for section, keys in REQUIRED_EFFECT_KEYS.items():
+            for key in keys:
+                effect_config[section][key]
+        for section in ("orbital", "wave"):
+            check_positive_int(f"{section}.word_count", effect_config[section]["word_count"])
+        if not effect_config["fade"]["pulse_amount"] >= 0:
+            raise ValueError(f"fade.pulse_amount não pode ser negativo: {effect_config['fade']['pulse_amount']!r}")
+        if not effect_config["orbital"]["radius"] > 0:
+            raise ValueError(f"orbital.radius deve ser positivo: {effect_config['orbital']['radius']!r}")
+        
+        perf_config = config.get_performance_config()
+        use_dirty_rects = perf_config["use_dirty_rects"]
+        trail_length = perf_config["trail_length"]
+        check_positive_int("trail_length", trail_length, minimum=0)
+        check_positive_int("swarm_objects", perf_config["swarm_objects"])
+        
+        effect_duration = config.EFFECT_DURATION
+        fps = config.FPS
+        if not effect_duration > 0 or not fps > 0:
+            raise ValueError(f"EFFECT_DURATION e FPS devem ser positivos: {effect_duration}, {fps}")
+        
+        advanced = config.ADVANCED_CONFIG
+        scale_chain_settings = (advanced["scale_chain_min"], advanced["scale_chain_max"],
+                                advanced["scale_chain_step"], advanced["scale_chain_smooth"],
+                                advanced["scale_chain_max_kb"])
+        ScaleChain.check_params(*scale_chain_settings[:3])
+        scale_chain_cache_kb = advanced["scale_chain_cache_kb"]
+        check_positive_int("scale_chain_cache_kb", scale_chain_cache_kb, minimum=0)
+        
+        palette = tuple(config.get_color_palette())
+        
+        # Texto ou fonte: invalida tudo que foi renderizado
+        text_changed = (config.TEXT, config.FONT_SIZE) != (self.text, self.font_size)
+        if text_changed:
+            font = pygame.font.Font(None, config.FONT_SIZE)
+            text_surface = font.render(config.TEXT, True, COLORS['WHITE'])
+            glyph_set = GlyphSet(font, config.TEXT)
+        else:
+            font, text_surface, glyph_set = self.font, self.text_surface, self.glyph_set
+        
+        # Paleta: sprites por cor
+        palette_changed = text_changed or palette != self.palette
+        if palette_changed:
+            sprite_cache = {color: font.render(config.TEXT, True, color) for color in palette}
+        else:
+            sprite_cache = self.sprite_cache
+        
+        # Cadeias são por cor e saem da fonte: só texto, fonte ou parâmetros da
+        # cadeia as invalidam (a paleta troca apenas os sprites acima)
+        chains_changed = text_changed or scale_chain_settings != self.scale_chain_settings
+        
+        # Tudo validado: troca o estado de uma vez
+        self.effect_config = effect_config
+        self.effect_duration = effect_duration
+        self.fps = fps
+        self.perf_config = perf_config
+        self.use_dirty_rects = use_dirty_rects
+        
+        if text_changed:
+            self.text = config.TEXT
+            self.font_size = config.FONT_SIZE
+            self.font = font
+            self.text_surface = text_surface
+            self.text_rect = text_surface.get_rect()
+            self.glyph_set = glyph_set
+        
+        self.palette = palette
+        self.sprite_cache = sprite_cache
+        self.scale_chain_settings = scale_chain_settings
+        self.scale_chain_cache_bytes = scale_chain_cache_kb * 1024
+        if chains_changed:
+            self.scale_chains = {}
+            self.scale_chain_bytes = 0
+            self.release_pulse_chains()
+        self.trim_scale_chains()
+        
+        # Comprimento do rastro: só o anel de áreas; a superfície é reaproveitada
+        if trail_length != self.trail_length:
+            self.trail_length = trail_length
+            self.trail_rects = [None] * (self.trail_length + 1)
+            self.trail_index = 0
+    
+    def request_reload(self, signum, frame):
+        """Handler de SIGHUP: recarrega na próxima troca de efeito"""
+        self.reload_requested = True
+    
+    def reload_config(self):
+        """Recarrega list_config.py se ele mudou ou se foi pedido via SIGHUP"""
+        if not (self.config_watcher.changed() or self.reload_requested):
+            return
+        self.reload_requested = False
+        
+        # Guarda o módulo atual para restaurá-lo se a nova configuração falhar
+        previous = dict(vars(config))
+        try:
+            importlib.reload(config)
+            self.apply_config()
+        except Exception as e:
+            vars(config).clear()
+            vars(config).update(previous)
+            print(f"Erro ao recarregar configuração (mantendo a anterior): {e!r}")
+            return
+        
+        print("Configuração recarregada")
+    
+    def next_effect(self):
+        """Avança para o próximo efeito, aplicando a configuração pendente"""
+        self.reload_config()
+        effects = list(EffectType)
+        current_index = effects.index(self.current_effect)
+        self.current_effect = effects[(current_index + 1) % len(effects)]
+        self.init_effect()
+    
     def init_display(self):
         """Inicializa o display, preferencialmente framebuffer"""
         try:
@@ -98,10 +545,94 @@ class ZagariScreensaver:
         pygame.display.set_caption("Zagari Screensaver")
         pygame.mouse.set_visible(False)
     
+    def build_scale_chain(self, surface: pygame.Surface, min_scale: float = None,
+                          max_scale: float = None, max_bytes: int = None) -> ScaleChain:
+        """Cria a cadeia de escalas conforme ADVANCED_CONFIG (intervalo e limite opcionais)"""
+        chain_min, chain_max, step, smooth, max_kb = self.scale_chain_settings
+        return ScaleChain(surface,
+                          chain_min if min_scale is None else min_scale,
+                          chain_max if max_scale is None else max_scale,
+                          step, smooth=smooth,
+                          max_bytes=max_kb * 1024 if max_bytes is None else max_bytes)
+    
+    def trim_scale_chains(self):
+        """Descarta as cadeias mais antigas até o total caber em scale_chain_cache_kb
+        
+        As cadeias do pulse_scale contam no total mas não saem daqui; a
+        cadeia mais recente também fica, senão seria refeita a cada frame.
+        """
+        while (len(self.scale_chains) > 1 and
+               self.scale_chain_bytes + self.pulse_chain_bytes > self.scale_chain_cache_bytes):
+            oldest = next(iter(self.scale_chains))
+            self.scale_chain_bytes -= self.scale_chains.pop(oldest).nbytes
+    
+    def build_pulse_chains(self):
+        """Monta antes do fade as cadeias das cores fixas do pulse_scale
+        
+        Cobrem só [1 - pulse_amount, 1 + pulse_amount], dentro do intervalo
+        configurado, e cada uma recebe 1/FADE_PULSE_COLOR_STEPS do limite do
+        cache; assim o desenho nunca escala.
+        """
+        chain_min, chain_max, _, _, max_kb = self.scale_chain_settings
+        pulse_amount = self.effect_config["fade"]["pulse_amount"]
+        min_scale = max(chain_min, 1.0 - pulse_amount)
+        max_scale = min(chain_max, 1.0 + pulse_amount)
+        if min_scale > max_scale:
+            min_scale, max_scale = chain_min, chain_max
+        max_bytes = min(max_kb * 1024, self.scale_chain_cache_bytes // FADE_PULSE_COLOR_STEPS)
+        
+        key = (self.text, self.font_size, min_scale, max_scale, max_bytes)
+        if key == self.pulse_chains_key:
+            return
+        
+        self.release_pulse_chains()
+        for color in FADE_PULSE_COLORS:
+            sprite = self.font.render(self.text, True, color)
+            chain = self.build_scale_chain(sprite, min_scale, max_scale, max_bytes)
+            self.pulse_chains[color] = chain
+            self.pulse_chain_bytes += chain.nbytes
+        self.pulse_chains_key = key
+        self.trim_scale_chains()
+    
+    def release_pulse_chains(self):
+        """Libera as cadeias do pulse_scale (fora do fade elas não são usadas)"""
+        self.pulse_chains = {}
+        self.pulse_chains_key = None
+        self.pulse_chain_bytes = 0
+    
+    def get_sprite(self, color: Tuple[int, int, int], scale: float = 1.0) -> pygame.Surface:
+        """Retorna o sprite na cor e escala pedidas, sem escalar por frame"""
+        if scale == 1.0:
+            sprite = self.sprite_cache.get(color)
+            if sprite is None:
+                sprite = self.font.render(self.text, True, color)
+            return sprite
+        
+        # Cores do pulse_scale já têm cadeia; as demais ganham a sua no primeiro
+        # uso e as mais antigas saem do cache quando passa do limite em bytes
+        chain = self.pulse_chains.get(color)
+        if chain is None:
+            chain = self.scale_chains.get(color)
+        if chain is None:
+            sprite = self.sprite_cache.get(color)
+            if sprite is None:
+                sprite = self.font.render(self.text, True, color)
+            chain = self.build_scale_chain(sprite)
+            self.scale_chains[color] = chain
+            self.scale_chain_bytes += chain.nbytes
+            self.trim_scale_chains()
+        return chain.get(scale)
+    
     def init_effect(self):
         """Inicializa o efeito atual"""
         self.text_objects.clear()
+        self.swarm_grid = None
         self.effect_start_time = pygame.time.get_ticks()
+        self.full_redraw = True
+        self.init_trails()
+        self.init_glyph_words()
+        if self.current_effect != EffectType.FADE:
+            self.release_pulse_chains()
         
         if self.current_effect == EffectType.BOUNCING:
             self.init_bouncing_effect()
@@ -114,21 +645,72 @@ class ZagariScreensaver:
         elif self.current_effect == EffectType.WAVE:
             self.init_wave_effect()
     
+    def init_trails(self):
+        """Prepara a superfície de rastros se o efeito atual usar trails"""
+        effect_config = self.effect_config[self.current_effect.name.lower()]
+        self.trails_active = effect_config.get("trails", False) and self.trail_length > 0
+        if not self.trails_active:
+            return
+        
+        # Mesmo formato do display (inclusive 16 bits): o blit final é uma cópia direta
+        if self.trail_surface is None:
+            self.trail_surface = self.screen.copy()
+        self.trail_surface.fill(COLORS['BLACK'])
+        
+        # Subtração constante: qualquer pixel chega a preto em trail_length frames.
+        # Em 16 bits a cor é quantizada, então o passo é conferido no formato da superfície
+        step = -(-255 // self.trail_length)
+        while min(self.trail_surface.unmap_rgb(
+                self.trail_surface.map_rgb((step, step, step)))[:3]) * self.trail_length < 255:
+            step += 1
+        self.trail_fade = (step, step, step)
+        for i in range(len(self.trail_rects)):
+            self.trail_rects[i] = None
+        self.trail_index = 0
+    
+    def init_glyph_words(self):
+        """Ativa o modo por letra e pré-aloca a sequência de blits"""
+        self.glyph_words = False
+        if self.current_effect not in (EffectType.WAVE, EffectType.ORBITAL):
+            return
+        
+        effect_config = self.effect_config[self.current_effect.name.lower()]
+        if not effect_config["per_glyph"]:
+            return
+        
+        self.glyph_words = True
+        total = effect_config["word_count"] * len(self.glyph_set.offsets)
+        self.glyph_blits = [[None, [0, 0]] for _ in range(total)]
+    
     def init_bouncing_effect(self):
-        """Efeito de texto saltitante"""
-        self.text_objects.append(TextObject(
-            x=random.randint(0, SCREEN_WIDTH - self.text_rect.width),
-            y=random.randint(0, SCREEN_HEIGHT - self.text_rect.height),
-            dx=random.choice([-3, -2, 2, 3]),
-            dy=random.choice([-3, -2, 2, 3]),
-            alpha=255,
-            color=random.choice(list(COLORS.values())),
-            angle=0,
-            scale=1.0
-        ))
+        """Efeito de texto saltitante (ou enxame com colisões)"""
+        bouncing_config = self.effect_config["bouncing"]
+        count = self.perf_config["swarm_objects"] if bouncing_config["swarm"] else 1
+        
+        for _ in range(count):
+            self.text_objects.append(TextObject(
+                x=random.randint(0, SCREEN_WIDTH - self.text_rect.width),
+                y=random.randint(0, SCREEN_HEIGHT - self.text_rect.height),
+                dx=random.choice([-3, -2, 2, 3]),
+                dy=random.choice([-3, -2, 2, 3]),
+                alpha=255,
+                color=random.choice(self.palette),
+                angle=0,
+                scale=1.0
+            ))
+        
+        if count > 1 and bouncing_config["swarm_collisions"]:
+            self.swarm_grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT,
+                                          self.text_rect.width, self.text_rect.height,
+                                          count)
     
     def init_fade_effect(self):
         """Efeito de fade in/out"""
+        if self.effect_config["fade"]["pulse_scale"]:
+            self.build_pulse_chains()
+        else:
+            self.release_pulse_chains()
+        
         self.text_objects.append(TextObject(
             x=(SCREEN_WIDTH - self.text_rect.width) // 2,
             y=(SCREEN_HEIGHT - self.text_rect.height) // 2,
@@ -142,16 +724,21 @@ class ZagariScreensaver:
     
     def init_orbital_effect(self):
         """Efeito orbital circular"""
-        self.text_objects.append(TextObject(
-            x=SCREEN_WIDTH // 2,
-            y=SCREEN_HEIGHT // 2,
-            dx=0,
-            dy=0,
-            alpha=255,
-            color=COLORS['YELLOW'],
-            angle=0,
-            scale=1.0
-        ))
+        orbital_config = self.effect_config["orbital"]
+        count = orbital_config["word_count"] if self.glyph_words else 1
+        
+        # Palavras distribuídas igualmente ao longo da órbita
+        for i in range(count):
+            self.text_objects.append(TextObject(
+                x=SCREEN_WIDTH // 2,
+                y=SCREEN_HEIGHT // 2,
+                dx=0,
+                dy=0,
+                alpha=255,
+                color=COLORS['YELLOW'],
+                angle=2 * math.pi * i / count,
+                scale=1.0
+            ))
     
     def init_matrix_effect(self):
         """Efeito matrix com múltiplas instâncias"""
@@ -169,16 +756,22 @@ class ZagariScreensaver:
     
     def init_wave_effect(self):
         """Efeito de onda senoidal"""
-        self.text_objects.append(TextObject(
-            x=0,
-            y=SCREEN_HEIGHT // 2,
-            dx=2,
-            dy=0,
-            alpha=255,
-            color=COLORS['PURPLE'],
-            angle=0,
-            scale=1.0
-        ))
+        wave_config = self.effect_config["wave"]
+        count = wave_config["word_count"] if self.glyph_words else 1
+        
+        # Palavras espaçadas igualmente no percurso horizontal
+        span = SCREEN_WIDTH + 2 * self.text_rect.width
+        for i in range(count):
+            self.text_objects.append(TextObject(
+                x=-i * span / count,
+                y=SCREEN_HEIGHT // 2,
+                dx=wave_config["speed"] if self.glyph_words else 2,
+                dy=0,
+                alpha=255,
+                color=COLORS['PURPLE'],
+                angle=0,
+                scale=1.0
+            ))
     
     def update_bouncing_effect(self, obj: TextObject):
         """Atualiza efeito bouncing"""
@@ -186,12 +779,36 @@ class ZagariScreensaver:
         obj.y += obj.dy
         
         # Colisão com bordas
-        if obj.x <= 0 or obj.x >= SCREEN_WIDTH - self.text_rect.width:
+        max_x = SCREEN_WIDTH - self.text_rect.width
+        max_y = SCREEN_HEIGHT - self.text_rect.height
+        if obj.x <= 0 or obj.x >= max_x:
+            obj.x = min(max(obj.x, 0), max_x)
             obj.dx *= -1
-            obj.color = random.choice(list(COLORS.values()))
-        if obj.y <= 0 or obj.y >= SCREEN_HEIGHT - self.text_rect.height:
+            obj.color = random.choice(self.palette)
+        if obj.y <= 0 or obj.y >= max_y:
+            obj.y = min(max(obj.y, 0), max_y)
             obj.dy *= -1
-            obj.color = random.choice(list(COLORS.values()))
+            obj.color = random.choice(self.palette)
+    
+    def resolve_swarm_collision(self, a: TextObject, b: TextObject):
+        """Colisão elástica entre dois textos do enxame (mesma massa)"""
+        overlap_x = self.text_rect.width - abs(a.x - b.x)
+        overlap_y = self.text_rect.height - abs(a.y - b.y)
+        
+        # Separa pelo eixo de menor penetração e troca as velocidades
+        # nesse eixo apenas se os objetos estiverem se aproximando
+        if overlap_x < overlap_y:
+            push = overlap_x / 2 if a.x < b.x else -overlap_x / 2
+            a.x -= push
+            b.x += push
+            if (b.x - a.x) * (b.dx - a.dx) < 0:
+                a.dx, b.dx = b.dx, a.dx
+        else:
+            push = overlap_y / 2 if a.y < b.y else -overlap_y / 2
+            a.y -= push
+            b.y += push
+            if (b.y - a.y) * (b.dy - a.dy) < 0:
+                a.dy, b.dy = b.dy, a.dy
     
     def update_fade_effect(self, obj: TextObject):
         """Atualiza efeito fade"""
@@ -203,22 +820,39 @@ class ZagariScreensaver:
         g = int(127 + 127 * math.sin(time_factor + 2))
         b = int(127 + 127 * math.sin(time_factor + 4))
         obj.color = (r, g, b)
+        
+        # Pulsação de escala (níveis da cadeia de escalas), mantendo o centro.
+        # A cor é quantizada em fases fixas para reaproveitar as cadeias
+        fade_config = self.effect_config["fade"]
+        if fade_config["pulse_scale"]:
+            step = int(round(time_factor * FADE_PULSE_COLOR_STEPS / (2 * math.pi)))
+            obj.color = FADE_PULSE_COLORS[step % FADE_PULSE_COLOR_STEPS]
+            obj.scale = 1.0 + fade_config["pulse_amount"] * math.sin(time_factor * 2)
+            obj.x = (SCREEN_WIDTH - self.text_rect.width * obj.scale) / 2
+            obj.y = (SCREEN_HEIGHT - self.text_rect.height * obj.scale) / 2
     
     def update_orbital_effect(self, obj: TextObject):
         """Atualiza efeito orbital"""
+        if self.glyph_words:
+            # Posição e cor de cada letra são calculadas no desenho
+            return
+        
         time_factor = (pygame.time.get_ticks() - self.effect_start_time) / 1000.0
-        radius = 150
+        orbital_config = self.effect_config["orbital"]
+        radius_x = orbital_config["radius"]
+        radius_y = radius_x * 0.6 if orbital_config["elliptical"] else radius_x
+        angle = time_factor * orbital_config["speed"]
         
         center_x = SCREEN_WIDTH // 2
         center_y = SCREEN_HEIGHT // 2
         
-        obj.x = center_x + radius * math.cos(time_factor) - self.text_rect.width // 2
-        obj.y = center_y + radius * math.sin(time_factor) - self.text_rect.height // 2
+        obj.x = center_x + radius_x * math.cos(angle) - self.text_rect.width // 2
+        obj.y = center_y + radius_y * math.sin(angle) - self.text_rect.height // 2
         
-        # Rotação da cor
-        r = int(127 + 127 * math.cos(time_factor))
-        g = int(127 + 127 * math.cos(time_factor + 2))
-        b = int(127 + 127 * math.cos(time_factor + 4))
+        # Rotação da cor, acompanhando a posição na órbita como no modo por letra
+        r = int(127 + 127 * math.cos(angle))
+        g = int(127 + 127 * math.cos(angle + 2))
+        b = int(127 + 127 * math.cos(angle + 4))
         obj.color = (r, g, b)
     
     def update_matrix_effect(self, obj: TextObject):
@@ -238,15 +872,20 @@ class ZagariScreensaver:
     def update_wave_effect(self, obj: TextObject):
         """Atualiza efeito wave"""
         obj.x += obj.dx
-        time_factor = (pygame.time.get_ticks() - self.effect_start_time) / 1000.0
-        
-        # Movimento senoidal
-        obj.y = SCREEN_HEIGHT // 2 + 100 * math.sin(time_factor * 2 + obj.x * 0.01)
         
         # Reset quando sai da tela
         if obj.x > SCREEN_WIDTH + self.text_rect.width:
             obj.x = -self.text_rect.width
         
+        if self.glyph_words:
+            # Posição e cor de cada letra são calculadas no desenho
+            return
+        
+        time_factor = (pygame.time.get_ticks() - self.effect_start_time) / 1000.0
+        
+        # Movimento senoidal
+        obj.y = SCREEN_HEIGHT // 2 + 100 * math.sin(time_factor * 2 + obj.x * 0.01)
+        
         # Mudança de cor baseada na posição
         r = int(127 + 127 * math.sin(obj.x * 0.01))
         g = int(127 + 127 * math.sin(obj.x * 0.01 + 2))
@@ -259,10 +898,7 @@ class ZagariScreensaver:
         
         # Troca de efeito
         if current_time - self.effect_start_time > self.effect_duration:
-            effects = list(EffectType)
-            current_index = effects.index(self.current_effect)
-            self.current_effect = effects[(current_index + 1) % len(effects)]
-            self.init_effect()
+            self.next_effect()
         
         # Atualiza objetos baseado no efeito atual
         for obj in self.text_objects:
@@ -276,26 +912,140 @@ class ZagariScreensaver:
                 self.update_matrix_effect(obj)
             elif self.current_effect == EffectType.WAVE:
                 self.update_wave_effect(obj)
+        
+        # Colisões entre os objetos do enxame
+        if self.swarm_grid is not None:
+            self.swarm_grid.rebuild(self.text_objects)
+            self.swarm_grid.query_pairs(self.text_objects, self.resolve_swarm_collision)
     
-    def draw(self):
-        """Desenha o screensaver"""
-        self.screen.fill(COLORS['BLACK'])
+    def layout_wave_glyphs(self, time_factor: float):
+        """Posiciona cada letra na onda usando as tabelas de seno"""
+        wave_config = self.effect_config["wave"]
+        glyphs = self.glyph_set
+        amplitude = wave_config["amplitude"]
+        center_y = SCREEN_HEIGHT // 2
+        # Fase da onda: frequency * t + x * 0.01, já convertida para índice da tabela
+        time_index = time_factor * wave_config["frequency"] * TRIG_TABLE_SCALE
+        x_scale = 0.01 * TRIG_TABLE_SCALE
         
+        slot = 0
         for obj in self.text_objects:
-            # Criar surface com alpha
-            text_surf = self.font.render("ZAGARI", True, obj.color)
-            if obj.alpha < 255:
-                text_surf.set_alpha(obj.alpha)
-            
-            # Aplicar escala se necessário
-            if obj.scale != 1.0:
-                new_size = (int(text_surf.get_width() * obj.scale), 
-                           int(text_surf.get_height() * obj.scale))
-                text_surf = pygame.transform.scale(text_surf, new_size)
+            for i in range(len(glyphs.offsets)):
+                x = obj.x + glyphs.offsets[i]
+                index = int(x * x_scale)
+                entry = self.glyph_blits[slot]
+                entry[0] = glyphs.ramp[glyphs.color_index(index)][i]
+                entry[1][0] = int(x)
+                entry[1][1] = int(center_y + amplitude * SIN_TABLE[int(time_index + index) & TRIG_TABLE_MASK])
+                slot += 1
+    
+    def layout_orbital_glyphs(self, time_factor: float):
+        """Posiciona cada letra na órbita (circular ou elíptica)"""
+        orbital_config = self.effect_config["orbital"]
+        glyphs = self.glyph_set
+        radius_x = orbital_config["radius"]
+        radius_y = radius_x * 0.6 if orbital_config["elliptical"] else radius_x
+        center_x = SCREEN_WIDTH // 2 - glyphs.width // (2 * max(1, len(glyphs.offsets)))
+        center_y = SCREEN_HEIGHT // 2 - glyphs.height // 2
+        time_index = time_factor * orbital_config["speed"] * TRIG_TABLE_SCALE
+        # Cada letra fica à frente da anterior pelo comprimento de arco do seu offset
+        arc_scale = TRIG_TABLE_SCALE / radius_x
+        # A cor usa cos(fase) = sin(fase + pi/2)
+        color_shift = TRIG_TABLE_SIZE // 4
+        
+        slot = 0
+        for obj in self.text_objects:
+            word_index = time_index + obj.angle * TRIG_TABLE_SCALE
+            for i in range(len(glyphs.offsets)):
+                index = int(word_index + glyphs.offsets[i] * arc_scale) & TRIG_TABLE_MASK
+                entry = self.glyph_blits[slot]
+                entry[0] = glyphs.ramp[glyphs.color_index(index + color_shift)][i]
+                entry[1][0] = int(center_x + radius_x * COS_TABLE[index])
+                entry[1][1] = int(center_y + radius_y * SIN_TABLE[index])
+                slot += 1
+    
+    def draw_glyph_words(self, target: pygame.Surface) -> List[pygame.Rect]:
+        """Desenha todas as letras com uma única chamada a blits()"""
+        time_factor = (pygame.time.get_ticks() - self.effect_start_time) / 1000.0
+        if self.current_effect == EffectType.WAVE:
+            self.layout_wave_glyphs(time_factor)
+        else:
+            self.layout_orbital_glyphs(time_factor)
+        
+        return target.blits(self.glyph_blits)
+    
+    def draw_objects(self, target: pygame.Surface) -> List[pygame.Rect]:
+        """Desenha os objetos em target e retorna as áreas alteradas"""
+        if self.glyph_words:
+            return self.draw_glyph_words(target)
+        
+        rects = []
+        
+        for obj in self.text_objects:
+            # Sprite pré-calculado na cor e escala do objeto. O sprite é
+            # compartilhado: alpha 255 mantém o alpha por pixel, None o removeria
+            text_surf = self.get_sprite(obj.color, obj.scale)
+            text_surf.set_alpha(obj.alpha)
             
-            self.screen.blit(text_surf, (int(obj.x), int(obj.y)))
+            rects.append(target.blit(text_surf, (int(obj.x), int(obj.y))))
         
-        pygame.display.flip()
+        return rects
+    
+    def draw_trails(self):
+        """Desenha sobre a superfície de rastros, esmaecida a cada frame"""
+        if self.use_dirty_rects and not self.full_redraw:
+            # Só a área ainda ocupada por rastros precisa ser esmaecida
+            region = self.trail_region()
+            if region is not None:
+                self.trail_surface.fill(self.trail_fade, region,
+                                        special_flags=pygame.BLEND_RGB_SUB)
+        else:
+            self.trail_surface.fill(self.trail_fade, special_flags=pygame.BLEND_RGB_SUB)
+        
+        rects = self.draw_objects(self.trail_surface)
+        
+        # Guarda a área deste frame; após trail_length + 1 frames ela já está preta
+        self.trail_rects[self.trail_index] = rects[0].unionall(rects) if rects else None
+        self.trail_index = (self.trail_index + 1) % len(self.trail_rects)
+        
+        if not self.use_dirty_rects or self.full_redraw:
+            self.screen.blit(self.trail_surface, (0, 0))
+            pygame.display.flip()
+            self.full_redraw = False
+            return
+        
+        region = self.trail_region()
+        if region is not None:
+            self.screen.blit(self.trail_surface, region, region)
+            pygame.display.update(region)
+    
+    def trail_region(self):
+        """União das áreas desenhadas nos últimos frames do rastro"""
+        region = None
+        for rect in self.trail_rects:
+            if rect:
+                region = rect.copy() if region is None else region.union(rect)
+        return region
+    
+    def draw(self):
+        """Desenha o screensaver"""
+        if self.trails_active:
+            self.draw_trails()
+            return
+        
+        if not self.use_dirty_rects or self.full_redraw:
+            self.screen.fill(COLORS['BLACK'])
+            self.dirty_rects = self.draw_objects(self.screen)
+            pygame.display.flip()
+            self.full_redraw = False
+            return
+        
+        # Apaga as áreas do frame anterior e atualiza só o que mudou
+        for rect in self.dirty_rects:
+            self.screen.fill(COLORS['BLACK'], rect)
+        rects = self.draw_objects(self.screen)
+        pygame.display.update(self.dirty_rects + rects)
+        self.dirty_rects = rects
     
     def handle_events(self):
         """Processa eventos"""
@@ -307,10 +1057,7 @@ class ZagariScreensaver:
                     self.running = False
                 elif event.key == pygame.K_SPACE:
                     # Troca efeito manualmente
-                    effects = list(EffectType)
-                    current_index = effects.index(self.current_effect)
-                    self.current_effect = effects[(current_index + 1) % len(effects)]
-                    self.init_effect()
+                    self.next_effect()
     
     def run(self):
         """Loop principal"""
@@ -322,13 +1069,51 @@ class ZagariScreensaver:
             self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            self.clock.tick(self.fps)
         
+        self.config_watcher.close()
         pygame.quit()
         sys.exit()
 
+def benchmark_collisions(counts=(50, 100, 200, 400, 800, 1600), steps=100):
+    """Mede o custo das colisões do enxame conforme o número de objetos
+    
+    A área cresce junto com o número de objetos (densidade constante),
+    então um custo por objeto estável indica escala quase linear.
+    """
+    width, height = 140, 50  # Tamanho aproximado de "ZAGARI" em 72pt
+    
+    print(f"{'objetos':>8} {'ms/passo':>10} {'us/objeto':>10} {'testes':>8} {'todos pares':>12}")
+    for count in counts:
+        side = int(math.sqrt(count * width * height * 4))
+        objects = [TextObject(x=random.uniform(0, side), y=random.uniform(0, side),
+                              dx=random.uniform(-3, 3), dy=random.uniform(-3, 3),
+                              alpha=255, color=COLORS['WHITE'], angle=0, scale=1.0)
+                   for _ in range(count)]
+        grid = SpatialGrid(side, side, width, height, count)
+        hits = [0]
+        
+        def handler(a, b):
+            hits[0] += 1
+        
+        start = time.perf_counter()
+        for _ in range(steps):
+            for obj in objects:
+                obj.x = (obj.x + obj.dx) % side
+                obj.y = (obj.y + obj.dy) % side
+            grid.rebuild(objects)
+            grid.query_pairs(objects, handler)
+        elapsed = (time.perf_counter() - start) / steps
+        
+        print(f"{count:>8} {elapsed * 1000:>10.3f} {elapsed * 1e6 / count:>10.2f} "
+              f"{grid.pair_checks:>8} {count * (count - 1) // 2:>12}")
+
 def main():
     """Função principal"""
+    if "--benchmark-collisions" in sys.argv:
+        benchmark_collisions()
+        return
+    
     try:
         screensaver = ZagariScreensaver()
         screensaver.run()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Testes do monitor_screensaver contra uma árvore /proc e /sys falsa
+Execute com: python3 -m unittest test_monitor_screensaver
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import monitor_screensaver as monitor
+
+class FakeProcTest(unittest.TestCase):
+    """Monta /proc e /sys mínimos em um diretório temporário"""
+    
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.proc_root = os.path.join(self.root, "proc")
+        self.sys_root = os.path.join(self.root, "sys")
+        
+        # Screensaver executado pelo interpretador com opções antes do script
+        self.write_cmdline(42, [b"/usr/bin/python3", b"-u", b"screensaver.py"])
+        self.write("proc/42/status", "Name:\tpython3\nVmRSS:\t   40960 kB\n")
+        # Processos que o pgrep -f antigo confundiria
+        self.write_cmdline(43, [b"python3", b"monitor_screensaver.py"])
+        self.write_cmdline(44, [b"nano", b"screensaver.py"])
+        self.write_cmdline(45, [b"python3", b"zagari_screensaver.py"])
+        
+        self.write("proc/meminfo", "MemTotal:  948280 kB\nMemAvailable:  524288 kB\n")
+        self.write("sys/class/thermal/thermal_zone0/temp", "48312\n")
+        self.set_ticks(total=1000, busy=100, process=10)
+    
+    def tearDown(self):
+        shutil.rmtree(self.root)
+    
+    def write(self, path: str, content: str):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+    
+    def write_cmdline(self, pid: int, argv):
+        path = os.path.join(self.proc_root, str(pid), "cmdline")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"\0".join(argv) + b"\0")
+    
+    def set_ticks(self, total: int, busy: int, process: int):
+        """Atualiza /proc/stat (2 CPUs) e utime do processo 42 (stime fixo em 5)"""
+        self.write("proc/stat", f"cpu  {busy} 0 0 {total - busy} 0 0 0 0 0 0\n"
+                                "cpu0 1 1 1 1\ncpu1 1 1 1 1\nintr 1\n")
+        # Nome (comm) com espaço e parênteses, como permite o kernel
+        self.write("proc/42/stat", f"42 (python3 (x) y) S 1 1 1 0 -1 0 0 0 0 0 "
+                                   f"{process - 5} 5 0 0 20 0 1 0 0 0 0\n")
+    
+    def test_find_pids_matches_interpreter_argv_only(self):
+        self.assertEqual(monitor.find_pids(proc_root=self.proc_root), [42])
+    
+    def test_sample_and_flush(self):
+        sampler = monitor.Sampler(self.proc_root, self.sys_root)
+        
+        # Primeira amostra: sem deltas, ainda sem CPU
+        values = sampler.sample()
+        self.assertEqual(sampler.pid, 42)
+        self.assertIsNone(values["cpu_pct"])
+        self.assertIsNone(values["sys_cpu_pct"])
+        self.assertEqual(values["rss_mb"], 40.0)
+        self.assertEqual(values["mem_avail_mb"], 512.0)
+        self.assertAlmostEqual(values["temp_c"], 48.312)
+        
+        # 200 ticks totais em 2 CPUs: 50 ticks do processo = 50% de um núcleo
+        self.set_ticks(total=1200, busy=150, process=60)
+        values = sampler.sample()
+        self.assertAlmostEqual(values["cpu_pct"], 50.0)
+        self.assertAlmostEqual(values["sys_cpu_pct"], 25.0)
+        
+        self.set_ticks(total=1400, busy=170, process=70)
+        values = sampler.sample()
+        self.assertAlmostEqual(values["cpu_pct"], 10.0)
+        self.assertAlmostEqual(values["sys_cpu_pct"], 10.0)
+        
+        record = sampler.flush(timestamp=1000)
+        self.assertEqual(record["t"], 1000)
+        self.assertEqual(record["n"], 3)
+        self.assertEqual(record["pid"], 42)
+        self.assertEqual(record["cpu_pct"], [10.0, 30.0, 50.0])
+        self.assertEqual(record["sys_cpu_pct"], [10.0, 17.5, 25.0])
+        self.assertEqual(record["rss_mb"], [40.0, 40.0, 40.0])
+        self.assertEqual(record["temp_c"], [48.3, 48.3, 48.3])
+        
+        # A janela recomeça vazia
+        self.assertEqual(sampler.window_samples, 0)
+        self.assertNotIn("cpu_pct", sampler.flush(timestamp=1001))
+    
+    def test_process_restart_resets_cpu_delta(self):
+        sampler = monitor.Sampler(self.proc_root, self.sys_root)
+        sampler.sample()
+        
+        # Processo 42 terminou e o screensaver voltou como 50
+        self.set_ticks(total=1200, busy=150, process=60)
+        shutil.rmtree(os.path.join(self.proc_root, "42"))
+        self.write_cmdline(50, [b"python3", b"screensaver.py"])
+        self.write("proc/50/stat", "50 (python3) S 1 1 1 0 -1 0 0 0 0 0 900 0 0 0 20 0 1 0 0 0 0\n")
+        
+        values = sampler.sample()
+        self.assertEqual(sampler.pid, 50)
+        self.assertIsNone(values["cpu_pct"])
+    
+    def test_records_round_trip(self):
+        path = os.path.join(self.root, "monitor.jsonl")
+        for t in range(3):
+            monitor.append_record(path, {"t": t, "n": 1, "pid": 42})
+        
+        self.assertEqual([r["t"] for r in monitor.read_records(path, 2)], [1, 2])
+        self.assertEqual(monitor.read_records(path, 0), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Testes das estruturas do screensaver que não precisam de display
+Execute com: python3 -m unittest test_screensaver
+"""
+
+import random
+import unittest
+
+import pygame
+
+from screensaver import ScaleChain, SpatialGrid, TextObject
+
+def make_object(x: float, y: float) -> TextObject:
+    return TextObject(x=x, y=y, dx=0, dy=0, alpha=255, color=(255, 255, 255), angle=0, scale=1.0)
+
+class SpatialGridTest(unittest.TestCase):
+    """query_pairs deve achar exatamente os pares da busca por força bruta"""
+    
+    WIDTH = 720
+    HEIGHT = 576
+    CELL_WIDTH = 90
+    CELL_HEIGHT = 40
+    
+    def grid_pairs(self, objects):
+        grid = SpatialGrid(self.WIDTH, self.HEIGHT, self.CELL_WIDTH, self.CELL_HEIGHT, len(objects))
+        grid.rebuild(objects)
+        index = {id(obj): i for i, obj in enumerate(objects)}
+        pairs = []
+        grid.query_pairs(objects, lambda a, b: pairs.append(frozenset((index[id(a)], index[id(b)]))))
+        
+        # Cada par é entregue uma única vez
+        self.assertEqual(len(pairs), len(set(pairs)))
+        return set(pairs)
+    
+    def brute_force_pairs(self, objects):
+        pairs = set()
+        for i in range(len(objects)):
+            for j in range(i + 1, len(objects)):
+                a = objects[i]
+                b = objects[j]
+                if abs(a.x - b.x) < self.CELL_WIDTH and abs(a.y - b.y) < self.CELL_HEIGHT:
+                    pairs.add(frozenset((i, j)))
+        return pairs
+    
+    def test_random_layouts_match_brute_force(self):
+        rng = random.Random(1234)
+        for count in (2, 10, 60, 200):
+            for _ in range(20):
+                # Inclui objetos fora da tela, presos nas células das bordas
+                objects = [make_object(rng.uniform(-200, self.WIDTH + 200),
+                                       rng.uniform(-100, self.HEIGHT + 100))
+                           for _ in range(count)]
+                self.assertEqual(self.grid_pairs(objects), self.brute_force_pairs(objects))
+    
+    def test_negative_and_edge_coordinates(self):
+        objects = [
+            make_object(-5, -5), make_object(40, 20),               # canto superior esquerdo
+            make_object(-150, 10), make_object(-70, 30),            # ambos antes da coluna 0
+            make_object(-300, 300), make_object(60, 300),           # longe, mesma célula presa
+            make_object(self.WIDTH - 10, self.HEIGHT - 10),
+            make_object(self.WIDTH + 60, self.HEIGHT + 20),         # além do canto inferior direito
+            make_object(self.WIDTH + 400, self.HEIGHT + 20),
+            make_object(0, 100), make_object(self.CELL_WIDTH, 100), # distância igual à célula: não colide
+        ]
+        pairs = self.grid_pairs(objects)
+        self.assertEqual(pairs, self.brute_force_pairs(objects))
+        self.assertIn(frozenset((0, 1)), pairs)
+        self.assertIn(frozenset((2, 3)), pairs)
+        self.assertIn(frozenset((6, 7)), pairs)
+        self.assertNotIn(frozenset((4, 5)), pairs)
+        self.assertNotIn(frozenset((9, 10)), pairs)
+    
+    def test_stacked_objects(self):
+        objects = [make_object(100, 100) for _ in range(5)]
+        self.assertEqual(len(self.grid_pairs(objects)), 10)
+
+class ScaleChainTest(unittest.TestCase):
+    """Níveis dentro do intervalo, 1.0 sem cópia e limite de memória respeitado"""
+    
+    def setUp(self):
+        self.surface = pygame.Surface((140, 50), pygame.SRCALPHA)
+        self.surface.fill((255, 255, 0, 128))
+    
+    def level_scales(self, chain):
+        return [level.get_width() / self.surface.get_width() for level in chain.levels]
+    
+    def test_levels_stay_in_range_and_reuse_original(self):
+        chain = ScaleChain(self.surface, 0.5, 1.2, 0.05, max_bytes=10 * 1024 * 1024)
+        scales = self.level_scales(chain)
+        self.assertGreaterEqual(min(scales), 0.5 - 0.01)
+        self.assertLessEqual(max(scales), 1.2 + 0.01)
+        self.assertIs(chain.get(1.0), self.surface)
+        self.assertIs(chain.get(1.02), self.surface)
+        self.assertIs(chain.get(0.1), chain.levels[0])
+        self.assertIs(chain.get(3.0), chain.levels[-1])
+    
+    def test_max_bytes_is_respected(self):
+        for max_kb in (512, 100, 20, 1, 0):
+            chain = ScaleChain(self.surface, 0.5, 1.2, 0.05, max_bytes=max_kb * 1024)
+            copies = [level for level in chain.levels if level is not self.surface]
+            size = sum(level.get_width() * level.get_height() * level.get_bytesize()
+                       for level in copies)
+            self.assertEqual(chain.nbytes, size)
+            self.assertLessEqual(chain.nbytes, max_kb * 1024)
+            # O nível 1.0 nunca é descartado: não custa memória
+            self.assertIn(self.surface, chain.levels)
+    
+    def test_invalid_params(self):
+        for params in ((0.5, 1.2, 0), (0, 1.2, 0.05), (1.2, 0.5, 0.05)):
+            with self.assertRaises(ValueError):
+                ScaleChain.check_params(*params)
+
+if __name__ == "__main__":
+    unittest.main()